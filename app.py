@@ -1,21 +1,109 @@
+import asyncio
 import os
-from datetime import timezone
+import time
+from datetime import datetime, timezone
 from typing import Optional
 
-from dateutil import parser as dtparser
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.responses import PlainTextResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 
-from ics_normalizer import compute_etag, normalize_upstream_to_ics
+from ics_normalizer import _parse_iso, compute_etag, normalize_upstream_to_ics
 
 load_dotenv()
 
 
+def _to_utc(value: str) -> datetime:
+    # Naive inputs mean UTC; astimezone on a naive datetime would instead
+    # assume server-local time. Already-UTC values pass through untouched.
+    dt = _parse_iso(value)
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
 class CalendarResponse(PlainTextResponse):
     media_type = "text/calendar; charset=UTF-8"
 
 
+# In-process response cache: the output is declared stable for an hour via
+# Cache-Control, so recomputing it per request is wasted work. Keyed by the
+# full query-param tuple; values are (expiry, ical_bytes, etag).
+CACHE_TTL = 3600
+CACHE_MAX_ENTRIES = 256
+_response_cache: dict = {}
+_response_cache_lock = asyncio.Lock()
+
+
+async def _cache_get(key):
+    async with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1], entry[2]
+        if entry:
+            del _response_cache[key]
+    return None
+
+
+async def _cache_put(key, ical_bytes: bytes, etag: str):
+    async with _response_cache_lock:
+        now = time.monotonic()
+        if len(_response_cache) >= CACHE_MAX_ENTRIES:
+            for k in [k for k, v in _response_cache.items() if v[0] <= now]:
+                del _response_cache[k]
+        if len(_response_cache) >= CACHE_MAX_ENTRIES:
+            oldest = min(_response_cache, key=lambda k: _response_cache[k][0])
+            del _response_cache[oldest]
+        _response_cache[key] = (now + CACHE_TTL, ical_bytes, etag)
+
+
+# Background-refreshed cache for default-window feeds (no explicit
+# start/end): the hot subscription case. A slot holds [body, etag,
+# last_access] and is kept warm by a per-feed task, so steady-state
+# requests are a dict lookup instead of a recompute. Slots idle for
+# longer than FEED_IDLE_TTL are evicted and their task stops.
+FEED_REFRESH_INTERVAL = 300
+FEED_IDLE_TTL = 3600
+FEED_CACHE_MAX = 64
+_feed_cache: dict = {}
+_feed_tasks: dict = {}
+
+
+async def _compute_feed(source, tzid, default_tzid, tz_strategy) -> bytes:
+    return await run_in_threadpool(
+        normalize_upstream_to_ics,
+        source_url=source,
+        start=None,
+        end=None,
+        tzid=tzid,
+        default_tzid=default_tzid,
+        tz_strategy=tz_strategy,
+    )
+
+
+async def _feed_refresher(key):
+    source, tzid, default_tzid, tz_strategy = key
+    try:
+        while True:
+            await asyncio.sleep(FEED_REFRESH_INTERVAL)
+            slot = _feed_cache.get(key)
+            if slot is None:
+                return
+            if time.monotonic() - slot[2] > FEED_IDLE_TTL:
+                _feed_cache.pop(key, None)
+                return
+            try:
+                body = await _compute_feed(source, tzid, default_tzid, tz_strategy)
+            except Exception:
+                # Upstream hiccup: keep serving the previous slot
+                continue
+            slot[0] = body
+            slot[1] = compute_etag(body)
+    finally:
+        _feed_tasks.pop(key, None)
+
+
 # Disable OpenAPI docs unless environment is explicitly "dev"
 docs_url = "/docs" if os.getenv("ENVIRONMENT") == "dev" else None
 redoc_url = "/redoc" if os.getenv("ENVIRONMENT") == "dev" else None
@@ -23,6 +111,9 @@ openapi_url = "/openapi.json" if os.getenv("ENVIRONMENT") == "dev" else None
 
 app = FastAPI(
     title="ICS Normalizer Service",
+    # ORJSONResponse is deprecated as a fastapi re-export on 0.141+;
+    # switch to importing it from starlette/orjson directly when bumping.
+    default_response_class=ORJSONResponse,
     docs_url=docs_url,
     redoc_url=redoc_url,
     openapi_url=openapi_url,
@@ -48,25 +139,58 @@ async def calendar_ics(
       - default_tzid: assumed tz for naive source times
       - tz_strategy: tzid | utc | floating
     """
-    try:
-        start_dt = dtparser.isoparse(start).astimezone(timezone.utc) if start else None
-        end_dt = dtparser.isoparse(end).astimezone(timezone.utc) if end else None
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid start/end: {e}")
+    if not source.lower().startswith(("http://", "https://")):
+        raise HTTPException(status_code=400, detail="source must be an http(s) URL")
 
     try:
-        ical_bytes = normalize_upstream_to_ics(
-            source_url=source,
-            start=start_dt,
-            end=end_dt,
-            tzid=tzid,
-            default_tzid=default_tzid,
-            tz_strategy=tz_strategy,
-        )
+        start_dt = _to_utc(start) if start else None
+        end_dt = _to_utc(end) if end else None
     except Exception as e:
-        raise HTTPException(status_code=502, detail=f"Upstream/normalize error: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid start/end: {e}")
 
-    etag = compute_etag(ical_bytes)
+    feed_key = None
+    if start is None and end is None:
+        feed_key = (source, tzid, default_tzid, tz_strategy)
+        slot = _feed_cache.get(feed_key)
+        if slot:
+            slot[2] = time.monotonic()
+            inm = request.headers.get("If-None-Match")
+            if inm and inm.strip() == slot[1]:
+                return Response(status_code=304)
+            return CalendarResponse(
+                content=slot[0],
+                headers={"ETag": slot[1], "Cache-Control": "public, max-age=3600"},
+            )
+
+    cache_key = (source, start, end, tzid, default_tzid, tz_strategy)
+    cached = await _cache_get(cache_key)
+    if cached:
+        ical_bytes, etag = cached
+    else:
+        try:
+            # normalize_upstream_to_ics does blocking I/O plus CPU-heavy
+            # expansion; keep it off the event loop so requests overlap.
+            ical_bytes = await run_in_threadpool(
+                normalize_upstream_to_ics,
+                source_url=source,
+                start=start_dt,
+                end=end_dt,
+                tzid=tzid,
+                default_tzid=default_tzid,
+                tz_strategy=tz_strategy,
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=502, detail=f"Upstream/normalize error: {e}"
+            )
+
+        etag = compute_etag(ical_bytes)
+        if feed_key is not None and len(_feed_cache) < FEED_CACHE_MAX:
+            _feed_cache[feed_key] = [ical_bytes, etag, time.monotonic()]
+            if feed_key not in _feed_tasks:
+                _feed_tasks[feed_key] = asyncio.create_task(_feed_refresher(feed_key))
+        else:
+            await _cache_put(cache_key, ical_bytes, etag)
     inm = request.headers.get("If-None-Match")
     if inm and inm.strip() == etag:
         return Response(status_code=304)
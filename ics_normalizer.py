@@ -1,23 +1,110 @@
 import hashlib
+import os
+import threading
+import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from io import BytesIO
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo
 
 import recurring_ical_events
 import requests
 from dateutil import parser as dtparser
 from dateutil import tz
-from icalendar import Calendar, Event, Timezone
+from icalendar import Calendar, Component, Event
+from icalendar.timezone import tzid_from_tzinfo
 
 DEFAULT_TZID = "Europe/Paris"
 
-
-def load_ics(source: str, timeout: int = 20) -> bytes:
+# Shared session: pooled keep-alive connections amortize the TCP/TLS
+# handshake across requests, and compressed transfer is negotiated
+# explicitly for upstreams that honor it.
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "Accept-Encoding": "gzip, deflate",
+        "User-Agent": "ics-normalizer/1",
+    }
+)
+
+# Per-URL validators + last body for conditional GETs:
+# url -> (etag, last_modified, body, digest)
+# Mutated from threadpool workers, so eviction+insert happens under a lock.
+_UPSTREAM_CACHE_MAX = 256
+_upstream_cache: Dict[str, Tuple[str, str, bytes, str]] = {}
+_upstream_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=128)
+def _gettz(name: str):
+    # One tzinfo object per tzid: skips tzfile re-parsing and lets
+    # astimezone short-circuit on identity for repeated requests.
+    # ZoneInfo's C-level transition lookups beat dateutil's tzfile walk in
+    # the per-event astimezone calls; dateutil stays as fallback for names
+    # the zoneinfo database does not resolve.
+    try:
+        return ZoneInfo(name)
+    except (KeyError, ValueError, OSError):
+        return tz.gettz(name)
+
+
+def _parse_iso(s: str) -> datetime:
+    # Fast path for strings we produced ourselves via datetime.isoformat();
+    # fall back to dateutil's general grammar for externally supplied values.
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        return dtparser.isoparse(s)
+
+
+def load_ics(source: str, timeout: int = 20) -> Tuple[bytes, str]:
+    """Fetch the raw ICS and its content digest.
+
+    The digest is computed while streaming the download so unchanged
+    upstreams can be detected without a second pass over the body.
+    """
+    h = hashlib.blake2b(digest_size=16)
     if source.lower().startswith(("http://", "https://")):
-        r = requests.get(source, timeout=timeout)
-        r.raise_for_status()
-        return r.content
+        cached = _upstream_cache.get(source)
+        headers = {}
+        if cached:
+            if cached[0]:
+                headers["If-None-Match"] = cached[0]
+            if cached[1]:
+                headers["If-Modified-Since"] = cached[1]
+        # The with-block closes the response on every exit — including the
+        # bodyless 304 and raise_for_status paths — so the connection goes
+        # back to the session pool instead of leaking per conditional GET.
+        with _SESSION.get(source, timeout=timeout, stream=True, headers=headers) as r:
+            if r.status_code == 304 and cached:
+                # Drain the (empty) body: a merely closed streaming response
+                # drops the socket, a drained one is returned to the pool.
+                r.content
+                return cached[2], cached[3]
+            r.raise_for_status()
+            buf = BytesIO()
+            for chunk in r.iter_content(65536):
+                buf.write(chunk)
+                h.update(chunk)
+            etag = r.headers.get("ETag", "")
+            last_modified = r.headers.get("Last-Modified", "")
+        data, digest = buf.getvalue(), h.hexdigest()
+        if etag or last_modified:
+            with _upstream_cache_lock:
+                if len(_upstream_cache) >= _UPSTREAM_CACHE_MAX:
+                    _upstream_cache.pop(next(iter(_upstream_cache)), None)
+                _upstream_cache[source] = (etag, last_modified, data, digest)
+        return data, digest
+    # Local files are a dev convenience only; in production a bare path is
+    # either a mistake or an LFI attempt.
+    if os.getenv("ENVIRONMENT") != "dev":
+        raise ValueError("source must be an http(s) URL")
     with open(source, "rb") as f:
-        return f.read()
+        data = f.read()
+    h.update(data)
+    return data, h.hexdigest()
 
 
 def ensure_timezone(dt, default_tz):
@@ -36,31 +123,297 @@ def normalize_to_tz(dt: datetime, target_tz):
     return dt.astimezone(target_tz)
 
 
-def expand_events(cal: Calendar, start: datetime, end: datetime):
-    return recurring_ical_events.of(cal).between(start, end)
+# icalendar's parser eagerly types every property it sees; large feeds carry
+# plenty we never read (ATTENDEE, ATTACH, X-props, alarms). Stripping those
+# lines before Calendar.from_ical cuts parse time proportionally. Opt out
+# with ICS_NORMALIZER_FAST_PARSE=0 to feed the raw bytes through.
+_FAST_PARSE = os.getenv("ICS_NORMALIZER_FAST_PARSE", "1").lower() not in ("0", "false")
+
+_KEPT_VEVENT_PROPS = frozenset(
+    {
+        b"UID",
+        b"SUMMARY",
+        b"DESCRIPTION",
+        b"LOCATION",
+        b"DTSTART",
+        b"DTEND",
+        b"DURATION",
+        b"RRULE",
+        b"RDATE",
+        b"EXDATE",
+        b"EXRULE",
+        b"RECURRENCE-ID",
+        b"SEQUENCE",
+        b"STATUS",
+        b"TRANSP",
+        b"CATEGORIES",
+    }
+)
+
+
+def _prefilter_ics(ics_bytes: bytes) -> bytes:
+    """Drop VEVENT properties (and nested components) we never consume.
+
+    Works on folded lines directly: a dropped logical line also drops its
+    continuation lines, so no unfold/refold round-trip is needed. Only the
+    inside of VEVENTs is filtered; calendar-level properties and VTIMEZONE
+    definitions pass through untouched.
+    """
+    out = []
+    keep_previous = True
+    in_vevent = False
+    drop_depth = 0
+    for line in ics_bytes.splitlines(keepends=True):
+        if line[:1] in (b" ", b"\t"):
+            if keep_previous:
+                out.append(line)
+            continue
+        name, _, value = line.partition(b":")
+        name = name.split(b";", 1)[0].strip().upper()
+        if drop_depth:
+            if name == b"BEGIN":
+                drop_depth += 1
+            elif name == b"END":
+                drop_depth -= 1
+            keep_previous = False
+            continue
+        if name == b"BEGIN":
+            if in_vevent:
+                # Nested component (VALARM etc.) inside a VEVENT: skip whole
+                drop_depth = 1
+                keep_previous = False
+                continue
+            if value.strip().upper() == b"VEVENT":
+                in_vevent = True
+        elif name == b"END":
+            if value.strip().upper() == b"VEVENT":
+                in_vevent = False
+        elif in_vevent and name not in _KEPT_VEVENT_PROPS:
+            keep_previous = False
+            continue
+        keep_previous = True
+        out.append(line)
+    return b"".join(out)
+
+
+# Properties that mean an event needs real recurrence expansion
+_RECURRENCE_PROPS = ("RRULE", "RDATE", "RECURRENCE-ID")
+
+# Properties _emit_event reads from a source component
+_WANTED_PROPS = frozenset(
+    {
+        "UID",
+        "SUMMARY",
+        "DESCRIPTION",
+        "LOCATION",
+        "DTSTART",
+        "DTEND",
+        "DURATION",
+        "STATUS",
+        "TRANSP",
+        "CATEGORIES",
+    }
+)
+
+
+def _overlaps_window(
+    evt: Component, start: datetime, end: datetime, default_tz
+) -> bool:
+    dtstart_prop = evt.get("DTSTART")
+    if dtstart_prop is None:
+        return False
+    e_start = ensure_timezone(dtstart_prop.dt, default_tz)
+
+    dtend_prop = evt.get("DTEND")
+    if dtend_prop is not None:
+        e_end = ensure_timezone(dtend_prop.dt, default_tz)
+    else:
+        duration = evt.get("DURATION")
+        if duration:
+            e_end = e_start + duration.dt
+        elif not isinstance(dtstart_prop.dt, datetime):
+            e_end = e_start + timedelta(days=1)
+        else:
+            e_end = e_start
 
+    if e_end <= e_start:
+        return start <= e_start < end
+    return e_start < end and e_end > start
 
-def serialize_event(evt: Event, target_tz, default_tz) -> Dict[str, Any]:
-    def g(name):
-        return evt.get(name)
 
-    uid = str(g("UID") or "")
-    summary = str(g("SUMMARY") or "")
-    description = str(g("DESCRIPTION") or "")
-    location = str(g("LOCATION") or "")
-    organizer = str(g("ORGANIZER") or "")
+def expand_events(cal: Calendar, start: datetime, end: datetime, default_tz=None):
+    """Expand the calendar into occurrences within ``[start, end]``.
+
+    Non-recurring events only need a window-overlap check, so they are
+    filtered directly; recurrence expansion is reserved for components
+    that actually carry RRULE/RDATE/RECURRENCE-ID.
+    """
+    if default_tz is None:
+        default_tz = timezone.utc
+
+    # Naive datetimes get the calendar-level timezone applied by
+    # recurring_ical_events (via x_wr_timezone); keep those on the slow path.
+    wr_tzid = cal.get("X-WR-TIMEZONE")
+
+    static: List[Component] = []
+    recurring: List[Component] = []
+    for comp in cal.walk("VEVENT"):
+        if any(p in comp for p in _RECURRENCE_PROPS):
+            recurring.append(comp)
+            continue
+        if wr_tzid is not None:
+            dts = comp.get("DTSTART")
+            if (
+                dts is not None
+                and isinstance(dts.dt, datetime)
+                and dts.dt.tzinfo is None
+            ):
+                recurring.append(comp)
+                continue
+        if _overlaps_window(comp, start, end, default_tz):
+            static.append(comp)
+
+    if not recurring:
+        return static
+
+    rcal = Calendar()
+    for name, value in cal.items():
+        rcal[name] = value
+    for sub in cal.subcomponents:
+        if sub.name != "VEVENT":
+            rcal.add_component(sub)
+    for comp in recurring:
+        rcal.add_component(comp)
+
+    return static + list(recurring_ical_events.of(rcal).between(start, end))
+
+
+def _escape_text(text: str) -> str:
+    """RFC 5545 TEXT escaping, mirroring icalendar's rules exactly."""
+    # NOTE: order matters (see icalendar.parser._escape_char)
+    return (
+        text.replace(r"\N", "\n")
+        .replace("\\", "\\\\")
+        .replace(";", r"\;")
+        .replace(",", r"\,")
+        .replace("\r\n", r"\n")
+        .replace("\n", r"\n")
+        .replace("\r", r"\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """RFC 5545 line folding at 75 octets, matching icalendar's output."""
+    if len(line) < 75 and line.isascii():
+        return line
+    folded: List[str] = []
+    current: List[str] = []
+    byte_count = 0
+    for char in line:
+        char_len = len(char.encode("utf-8"))
+        if current and byte_count + char_len >= 75:
+            # Don't split a backslash/RFC 6868 escape across the boundary
+            if len(current) > 1 and current[-1] in "\\^":
+                escaped_prefix = current.pop()
+                folded.append("".join(current))
+                current = [escaped_prefix]
+                byte_count = 1
+            else:
+                folded.append("".join(current))
+                current = []
+                byte_count = 0
+        current.append(char)
+        byte_count += char_len
+    if current:
+        folded.append("".join(current))
+    return "\r\n ".join(folded)
+
 
-    dtstart = g("DTSTART").dt if g("DTSTART") else None
-    dtend = g("DTEND").dt if g("DTEND") else None
+def _line(content: str) -> bytes:
+    return (_fold(content) + "\r\n").encode("utf-8")
+
+
+def _param_value(value: str) -> str:
+    # Quote parameter values that contain separators, as icalendar does
+    if any(c in value for c in ',;:"'):
+        return '"%s"' % value.replace('"', "")
+    return value
+
+
+def _dt_line(name: str, val, tzid_param: Optional[str], utc_suffix: bool) -> bytes:
+    if isinstance(val, datetime):
+        s = (
+            f"{val.year:04}{val.month:02}{val.day:02}"
+            f"T{val.hour:02}{val.minute:02}{val.second:02}"
+        )
+        if utc_suffix:
+            s += "Z"
+        if tzid_param:
+            return _line(f"{name};TZID={_param_value(tzid_param)}:{s}")
+        return _line(f"{name}:{s}")
+    return _line(f"{name};VALUE=DATE:{val.year:04}{val.month:02}{val.day:02}")
+
+
+# Per-strategy output conversion, resolved once per calendar instead of
+# branching on the strategy string twice per event.
+def _conv_tzid(dt: datetime, all_day: bool):
+    return date(dt.year, dt.month, dt.day) if all_day else dt
+
+
+def _conv_utc(dt: datetime, all_day: bool):
+    return date(dt.year, dt.month, dt.day) if all_day else dt.astimezone(timezone.utc)
+
+
+def _conv_floating(dt: datetime, all_day: bool):
+    return date(dt.year, dt.month, dt.day) if all_day else dt.replace(tzinfo=None)
+
+
+_STRATEGY_CONVERTERS = {
+    "tzid": _conv_tzid,
+    "utc": _conv_utc,
+    "floating": _conv_floating,
+}
+
+
+class _EventRow(NamedTuple):
+    """Lightweight per-occurrence carrier: sort key + serialized VEVENT."""
+
+    start: datetime
+    uid: str
+    data: bytes
+
+
+def _emit_event(
+    evt: Event,
+    target_tz,
+    default_tz,
+    conv,
+    tzid_param: Optional[str],
+    utc_suffix: bool,
+) -> Optional[_EventRow]:
+    """Convert one expanded occurrence straight into serialized VEVENT bytes.
+
+    Returns an ``_EventRow`` — start/uid are the sort key — or ``None``
+    when the source component has no usable DTSTART.
+    """
+    # One walk over the component instead of a CaselessDict lookup per field
+    props = {k: v for k, v in evt.items() if k in _WANTED_PROPS}
+    g = props.get
+
+    dtstart_prop = g("DTSTART")
+    if dtstart_prop is None:
+        return None
+    dtstart = dtstart_prop.dt
+    dtend_prop = g("DTEND")
+    dtend = dtend_prop.dt if dtend_prop else None
     all_day = False
 
-    if dtstart is not None:
-        if not isinstance(dtstart, datetime):
-            all_day = True
-            dtstart = ensure_timezone(dtstart, target_tz)
-        else:
-            dtstart = ensure_timezone(dtstart, default_tz)
-        dtstart = normalize_to_tz(dtstart, target_tz)
+    if not isinstance(dtstart, datetime):
+        all_day = True
+        dtstart = ensure_timezone(dtstart, target_tz)
+    else:
+        dtstart = ensure_timezone(dtstart, default_tz)
+    dtstart = normalize_to_tz(dtstart, target_tz)
 
     if dtend is not None:
         if not isinstance(dtend, datetime):
@@ -69,146 +422,128 @@ def serialize_event(evt: Event, target_tz, default_tz) -> Dict[str, Any]:
         else:
             dtend = ensure_timezone(dtend, default_tz)
         dtend = normalize_to_tz(dtend, target_tz)
-
-    if dtstart and not dtend:
+    else:
         duration = g("DURATION")
         if duration:
             dtend = dtstart + duration.dt
         else:
             dtend = dtstart + (timedelta(days=1) if all_day else timedelta(minutes=0))
 
-    transparency = str(g("TRANSP") or "")
-    status = str(g("STATUS") or "")
+    # Properties are written straight into the output buffer; the order
+    # matches icalendar's canonical sort so the bytes stay identical to
+    # what Calendar.to_ical used to produce.
+    out = bytearray(b"BEGIN:VEVENT\r\n")
+    out += _line(f"SUMMARY:{_escape_text(str(g('SUMMARY') or ''))}")
+
+    out += _dt_line("DTSTART", conv(dtstart, all_day), tzid_param, utc_suffix)
+    out += _dt_line("DTEND", conv(dtend, all_day), tzid_param, utc_suffix)
+
+    # Unique UID per occurrence. We flatten recurring events into standalone
+    # instances (no RRULE), so every occurrence would otherwise carry the
+    # source event's single UID. Per RFC 5545, same UID + no RECURRENCE-ID =
+    # one event, so Google Calendar collapses them to a single occurrence.
+    # Appending the occurrence start keeps each instance distinct.
+    uid = str(g("UID") or "")
+    if uid:
+        stamp = dtstart.strftime("%Y%m%dT%H%M%SZ")
+        out += _line(f"UID:{_escape_text(uid)}-{stamp}")
+
     categories = g("CATEGORIES")
     if isinstance(categories, list):
         categories = [str(c) for c in categories]
     elif categories is not None:
         categories = [str(categories)]
+    if categories:
+        out += _line(f"CATEGORIES:{','.join(_escape_text(c) for c in categories)}")
 
-    return {
-        "uid": uid,
-        "summary": summary,
-        "description": description,
-        "location": location,
-        "organizer": organizer,
-        "start": dtstart.isoformat() if dtstart else None,
-        "end": dtend.isoformat() if dtend else None,
-        "all_day": all_day,
-        "status": status,
-        "transparency": transparency,
-        "categories": categories,
-        "raw_class": str(g("CLASS") or ""),
-    }
-
-
-def _build_vtimezone(tzid_str: str) -> Timezone:
-    tz_comp = Timezone()
-    tz_comp.add("tzid", tzid_str)
-    return tz_comp
-
+    description = str(g("DESCRIPTION") or "")
+    if description:
+        out += _line(f"DESCRIPTION:{_escape_text(description)}")
+    location = str(g("LOCATION") or "")
+    if location:
+        out += _line(f"LOCATION:{_escape_text(location)}")
+    status = str(g("STATUS") or "")
+    if status:
+        out += _line(f"STATUS:{_escape_text(status)}")
+    transparency = str(g("TRANSP") or "")
+    if transparency:
+        out += _line(f"TRANSP:{_escape_text(transparency)}")
 
-def _dt_for_strategy(dt: datetime, all_day: bool, strategy: str):
-    if all_day:
-        return date(dt.year, dt.month, dt.day)
-    if strategy == "utc":
-        return dt.astimezone(timezone.utc)
-    elif strategy == "floating":
-        return dt.replace(tzinfo=None)
-    else:  # tzid
-        return dt
+    out += b"END:VEVENT\r\n"
+    return _EventRow(dtstart, uid, bytes(out))
 
 
 def events_to_ics(
-    events: List[Dict[str, Any]],
+    instances: List[Event],
     calendar_name: str,
     tzid_str: str,
     tz_strategy: str = "tzid",
+    default_tzid: str = "UTC",
 ) -> bytes:
-    # Deterministic ordering
-    def parse_dt(iso):
-        try:
-            return dtparser.isoparse(iso) if iso else None
-        except Exception:
-            return None
-
-    events_sorted = sorted(
-        events,
-        key=lambda e: (
-            parse_dt(e.get("start")) or datetime.min.replace(tzinfo=timezone.utc),
-            e.get("uid") or "",
-        ),
+    target_tz = _gettz(tzid_str)
+    default_tz = _gettz(default_tzid)
+    conv = _STRATEGY_CONVERTERS.get(tz_strategy, _conv_tzid)
+    # Every non-all-day output datetime sits in the same zone, so the Z
+    # suffix and TZID parameter are per-calendar decisions, not per-event:
+    # UTC output gets the Z suffix and no TZID (the suffix already says
+    # it), floating output gets neither, anything else carries the tzid.
+    utc_suffix = tz_strategy == "utc" or (
+        tz_strategy != "floating"
+        and target_tz is not None
+        and tzid_from_tzinfo(target_tz) == "UTC"
     )
-
-    cal = Calendar()
-    cal.add("prodid", "-//ICS Normalizer//v1//EN")
-    cal.add("version", "2.0")
-    cal.add("calscale", "GREGORIAN")
-    cal.add("x-wr-calname", calendar_name)
-    cal.add("x-wr-timezone", tzid_str)
-
+    tzid_param = None
+    if tz_strategy not in ("utc", "floating") and not utc_suffix:
+        tzid_param = tzid_str
+
+    rows: List[_EventRow] = []
+    for evt in instances:
+        row = _emit_event(evt, target_tz, default_tz, conv, tzid_param, utc_suffix)
+        if row is not None:
+            rows.append(row)
+
+    # Deterministic ordering: (normalized start, uid), keyed in C
+    rows.sort(key=attrgetter("start", "uid"))
+
+    # Emit scaffolding and pre-serialized events into one buffer instead of
+    # walking an icalendar component tree in Calendar.to_ical.
+    buf = bytearray()
+    buf += b"BEGIN:VCALENDAR\r\n"
+    buf += b"VERSION:2.0\r\n"
+    buf += b"PRODID:-//ICS Normalizer//v1//EN\r\n"
+    buf += b"CALSCALE:GREGORIAN\r\n"
+    buf += _line(f"X-WR-CALNAME:{_escape_text(calendar_name)}")
+    buf += _line(f"X-WR-TIMEZONE:{_escape_text(tzid_str)}")
     if tz_strategy == "tzid":
-        cal.add_component(_build_vtimezone(tzid_str))
-
-    target_tz = tz.gettz(tzid_str)
-
-    for e in events_sorted:
-        ve = Event()
-        # Fixed property add order for determinism
-        ve.add("summary", e.get("summary") or "")
-
-        if e.get("location"):
-            ve.add("location", e["location"])
-        if e.get("description"):
-            ve.add("description", e["description"])
-
-        start_iso = e.get("start")
-        end_iso = e.get("end")
-        if not start_iso:
-            continue
-        start_dt = dtparser.isoparse(start_iso)
-        end_dt = dtparser.isoparse(end_iso) if end_iso else None
-
-        if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=target_tz)
-        else:
-            start_dt = start_dt.astimezone(target_tz)
-        if end_dt:
-            if end_dt.tzinfo is None:
-                end_dt = end_dt.replace(tzinfo=target_tz)
-            else:
-                end_dt = end_dt.astimezone(target_tz)
-
-        all_day = bool(e.get("all_day"))
-
-        # Unique UID per occurrence. We flatten recurring events into standalone
-        # instances (no RRULE), so every occurrence would otherwise carry the
-        # source event's single UID. Per RFC 5545, same UID + no RECURRENCE-ID =
-        # one event, so Google Calendar collapses them to a single occurrence.
-        # Appending the occurrence start keeps each instance distinct.
-        base_uid = e.get("uid") or ""
-        if base_uid:
-            ve.add("uid", f"{base_uid}-{start_dt.strftime('%Y%m%dT%H%M%SZ')}")
-
-        start_val = _dt_for_strategy(start_dt, all_day, tz_strategy)
-        end_val = _dt_for_strategy(end_dt or start_dt, all_day, tz_strategy)
-
-        if tz_strategy == "tzid" and not all_day:
-            ve.add("dtstart", start_val, parameters={"TZID": tzid_str})
-            ve.add("dtend", end_val, parameters={"TZID": tzid_str})
-        else:
-            ve.add("dtstart", start_val)
-            ve.add("dtend", end_val)
-
-        if e.get("status"):
-            ve.add("status", e["status"])
-        if e.get("transparency"):
-            ve.add("transp", e["transparency"])
-        if e.get("categories"):
-            ve.add("categories", e["categories"])
-
-        cal.add_component(ve)
-
-    return cal.to_ical()
+        buf += b"BEGIN:VTIMEZONE\r\n"
+        buf += _line(f"TZID:{_escape_text(tzid_str)}")
+        buf += b"END:VTIMEZONE\r\n"
+    for row in rows:
+        buf += row.data
+    buf += b"END:VCALENDAR\r\n"
+    return bytes(buf)
+
+
+# Normalized output keyed by upstream content digest + parameters: when the
+# upstream bytes have not changed we can skip parse/expand/serialize outright.
+# The TTL bounds window drift for callers relying on the default start/end.
+RESULT_CACHE_TTL = 3600
+RESULT_CACHE_MAX = 256
+_result_cache: Dict[tuple, Tuple[float, bytes]] = {}
+# Puts run on threadpool workers; serialize eviction so two requests
+# finishing together cannot race the sweep.
+_result_cache_lock = threading.Lock()
+
+
+def _result_cache_put(key: tuple, value: bytes) -> None:
+    now = time.monotonic()
+    with _result_cache_lock:
+        if len(_result_cache) >= RESULT_CACHE_MAX:
+            for k in [k for k, v in _result_cache.items() if v[0] <= now]:
+                del _result_cache[k]
+        if len(_result_cache) >= RESULT_CACHE_MAX:
+            del _result_cache[min(_result_cache, key=lambda k: _result_cache[k][0])]
+        _result_cache[key] = (now + RESULT_CACHE_TTL, value)
 
 
 def normalize_upstream_to_ics(
@@ -219,8 +554,14 @@ def normalize_upstream_to_ics(
     default_tzid: str = "UTC",
     tz_strategy: str = "tzid",
 ) -> bytes:
-    ics_bytes = load_ics(source_url)
-    cal = Calendar.from_ical(ics_bytes)
+    ics_bytes, upstream_digest = load_ics(source_url)
+
+    cache_key = (upstream_digest, start, end, tzid, default_tzid, tz_strategy)
+    cached = _result_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    cal = Calendar.from_ical(_prefilter_ics(ics_bytes) if _FAST_PARSE else ics_bytes)
 
     now = datetime.now(timezone.utc)
     if start is None:
@@ -228,16 +569,17 @@ def normalize_upstream_to_ics(
     if end is None:
         end = now + timedelta(days=90)
 
-    target_tz = tz.gettz(tzid)
-    default_tz = tz.gettz(default_tzid)
-
-    instances = expand_events(cal, start, end)
-    rows = [serialize_event(e, target_tz, default_tz) for e in instances]
-
-    return events_to_ics(rows, "Normalized Calendar", tzid, tz_strategy)
+    instances = expand_events(cal, start, end, _gettz(default_tzid))
+    result = events_to_ics(
+        instances, "Normalized Calendar", tzid, tz_strategy, default_tzid
+    )
+    _result_cache_put(cache_key, result)
+    return result
 
 
 def compute_etag(data: bytes) -> str:
-    # Strong ETag = SHA-256 of bytes
-    h = hashlib.sha256(data).hexdigest()
+    # Strong ETag = truncated BLAKE2b of bytes. ETags are opaque, so a
+    # 128-bit digest is plenty, and blake2b is markedly faster than
+    # sha256 on hosts without SHA hardware extensions.
+    h = hashlib.blake2b(data, digest_size=16).hexdigest()
     return f'"{h}"'